@@ -19,6 +19,13 @@ SCORE_LOADING_EXCEPTION = (
 )
 DEFAULT_TOKENIZER_FILE_NAME = "tokenizer.json"
 
+# Files of the token ids cache of DatasetMIDI, and of the packed DatasetBinary
+DATASET_CACHE_IDS_FILE_NAME = "ids.npy"
+DATASET_CACHE_OFFSETS_FILE_NAME = "offsets.npy"
+DATASET_CACHE_LABELS_FILE_NAME = "labels.npy"
+DATASET_CACHE_LABELS_OFFSETS_FILE_NAME = "labels_offsets.npy"
+DATASET_CACHE_METADATA_FILE_NAME = "metadata.json"
+
 # Starting id of chr() method for bytes equivalent of tokens.
 # The  first 5 (0 to 4 included) are ignored by 🤗tokenizers. We also skip the 32nd
 # (0x20) (space) as it is used to split sequences of characters into words.
@@ -232,6 +232,7 @@ class MusicTokenizer(ABC, HFHubMixin):
         self.tokens_types_graph = self._create_token_types_graph()
         self._add_special_tokens_to_types_graph()
         self._token_types_indexes = {}
+        self._token_id_types = {}
         self._update_token_types_indexes()
 
         # For logging
@@ -1937,24 +1938,34 @@ class MusicTokenizer(ABC, HFHubMixin):
             vocab += [f"PitchBend_{pitch_bend}" for pitch_bend in self.pitch_bends]
 
     def _update_token_types_indexes(self) -> None:
-        r"""Update the _token_types_indexes attribute according to _event_to_token."""
+        r"""Update the _token_types_indexes and _token_id_types attributes."""
 
-        def create_for_dict(voc: dict[str, int]) -> dict[str, list[int]]:
-            types_ = {}
+        def create_for_dict(
+            voc: dict[str, int],
+        ) -> tuple[dict[str, list[int]], dict[int, str]]:
+            # Both mappings are built in a single pass, splitting each token once
+            types_, id_types = {}, {}
             for event, token in voc.items():
                 token_type = event.split("_")[0]
                 if token_type in types_:
                     types_[token_type].append(token)
                 else:
                     types_[token_type] = [token]
-            return types_
+                # id (int) -> token type (str), to not have to split the token at each
+                # call of token_id_type
+                id_types[token] = token_type
+            return types_, id_types
 
         if self.is_multi_voc:
-            self._token_types_indexes = []
+            self._token_types_indexes, self._token_id_types = [], []
             for voc_i in self._vocab_base:
-                self._token_types_indexes.append(create_for_dict(voc_i))
+                types_, id_types = create_for_dict(voc_i)
+                self._token_types_indexes.append(types_)
+                self._token_id_types.append(id_types)
         else:
-            self._token_types_indexes = create_for_dict(self._vocab_base)
+            self._token_types_indexes, self._token_id_types = create_for_dict(
+                self._vocab_base
+            )
 
     def token_ids_of_type(
         self, token_type: str, vocab_id: int | None = None
@@ -2071,8 +2082,19 @@ class MusicTokenizer(ABC, HFHubMixin):
             applicable. (default: ``None``)
         :return: the type of the token, as a string
         """
-        token = self.__get_from_voc(id_, vocab_id)
-        return token.split("_")[0]
+        if self.is_multi_voc:
+            if vocab_id is None:
+                msg = "vocab_id must be provided for multi-vocabulary tokenizers."
+                raise ValueError(msg)
+            token_id_types = self._token_id_types[vocab_id]
+        else:
+            token_id_types = self._token_id_types
+        try:
+            return token_id_types[id_]
+        except KeyError:  # token added to the vocabulary after the initialization
+            token_type = self.__get_from_voc(id_, vocab_id).split("_")[0]
+            token_id_types[id_] = token_type
+            return token_type
 
     @abstractmethod
     def _create_token_types_graph(self) -> dict[str, set[str]]:
@@ -2,6 +2,7 @@
 
 from .collators import DataCollator
 from .datasets import (
+    DatasetBinary,
     DatasetJSON,
     DatasetMIDI,
 )
@@ -9,5 +10,6 @@ from .datasets import (
 __all__ = [
     "DatasetMIDI",
     "DatasetJSON",
+    "DatasetBinary",
     "DataCollator",
 ]
@@ -3,22 +3,47 @@
 from __future__ import annotations
 
 import json
+import os
+import pickle
+import re
 from abc import ABC
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from hashlib import sha256
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
+import torch
 from symusic import Score
 from torch import LongTensor
-from torch.utils.data import Dataset
+from torch.utils.data import Dataset, get_worker_info
 from tqdm import tqdm
 
-from miditok.constants import SCORE_LOADING_EXCEPTION
+from miditok.constants import (
+    CURRENT_SYMUSIC_VERSION,
+    DATASET_CACHE_IDS_FILE_NAME,
+    DATASET_CACHE_LABELS_FILE_NAME,
+    DATASET_CACHE_LABELS_OFFSETS_FILE_NAME,
+    DATASET_CACHE_METADATA_FILE_NAME,
+    DATASET_CACHE_OFFSETS_FILE_NAME,
+    SCORE_LOADING_EXCEPTION,
+)
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Mapping, Sequence
-    from pathlib import Path
+    from collections.abc import Callable, Iterable, Mapping
+    from concurrent.futures import Future
 
     from miditok import MusicTokenizer, TokSequence
 
+# Marker added at the beginning of the files created by split_files_for_training
+_CHUNK_MARKER_PATTERN = re.compile(r"miditok: chunk (\d+)/(\d+)")
+
 
 class _DatasetABC(Dataset, ABC):
     r"""
@@ -29,38 +54,47 @@ class _DatasetABC(Dataset, ABC):
 
     def __init__(
         self,
-    ) -> None:
-        self.__iter_count = 0
-
-    @staticmethod
-    def _preprocess_token_ids(
-        token_ids: list[int | list[int]],
         max_seq_len: int,
         bos_token_id: int | None = None,
         eos_token_id: int | None = None,
+    ) -> None:
+        self.max_seq_len = max_seq_len
+        self.bos_token_id = bos_token_id
+        self.eos_token_id = eos_token_id
+        # Created once, they are expanded to the number of vocabularies when added
+        self._bos_token = None if bos_token_id is None else LongTensor([bos_token_id])
+        self._eos_token = None if eos_token_id is None else LongTensor([eos_token_id])
+
+    def _preprocess_token_ids(
+        self,
+        token_ids: LongTensor,
+        add_bos_token: bool = True,
+        add_eos_token: bool = True,
         enforce_eos_token_if_seq_len_exceed_lim: bool = False,
-    ) -> list[int | list[int]]:
+    ) -> LongTensor:
         if len(token_ids) == 0:
             return token_ids
+        bos_token = self._bos_token if add_bos_token else None
+        eos_token = self._eos_token if add_eos_token else None
 
         # Reduce sequence length
-        max_seq_len -= sum([1 for t in [bos_token_id, eos_token_id] if t is not None])
+        num_special_tokens = (bos_token is not None) + (eos_token is not None)
+        max_seq_len = self.max_seq_len - num_special_tokens
         if len(token_ids) > max_seq_len:
             token_ids = token_ids[:max_seq_len]
             if not enforce_eos_token_if_seq_len_exceed_lim:
-                eos_token_id = None
-
-        # Adds BOS and EOS tokens
-        if bos_token_id:
-            if isinstance(token_ids[0], list):
-                bos_token_id = [bos_token_id] * len(token_ids[0])
-            token_ids.insert(0, bos_token_id)
-        if eos_token_id:
-            if isinstance(token_ids[0], list):
-                eos_token_id = [eos_token_id] * len(token_ids[0])
-            token_ids.append(eos_token_id)
+                eos_token = None
 
-        return token_ids
+        # Adds BOS and EOS tokens, for each vocabulary in case of multiple vocabularies
+        if bos_token is None and eos_token is None:
+            return token_ids
+        special_token_shape = (1, *token_ids.shape[1:])
+        to_concatenate = [token_ids]
+        if bos_token is not None:
+            to_concatenate.insert(0, bos_token.expand(special_token_shape))
+        if eos_token is not None:
+            to_concatenate.append(eos_token.expand(special_token_shape))
+        return torch.cat(to_concatenate)
 
     def __len__(self) -> int:
         raise NotImplementedError
@@ -68,17 +102,6 @@ class _DatasetABC(Dataset, ABC):
     def __getitem__(self, idx: int) -> Mapping[str, Any]:
         raise NotImplementedError
 
-    def __iter__(self) -> _DatasetABC:
-        return self
-
-    def __next__(self) -> Mapping[str, Any]:
-        if self.__iter_count >= len(self):
-            self.__iter_count = 0
-            raise StopIteration
-
-        self.__iter_count += 1
-        return self[self.__iter_count - 1]
-
 
 class DatasetMIDI(_DatasetABC):
     r"""
@@ -86,7 +109,15 @@ class DatasetMIDI(_DatasetABC):
 
     This class can be used for either tokenize music files on the fly when iterating it,
     or by pre-tokenizing all the files at its initialization and store the tokens in
-    memory.
+    memory. Pre-tokenized token ids are concatenated in a single array stored as
+    ``int16`` (or ``int32`` if the vocabulary has 32768 tokens or more) to reduce the
+    memory usage, and are converted to ``int64`` when the dataset is indexed, as
+    expected by PyTorch embedding layers. As such, the pre-tokenized samples and labels
+    are not stored as lists of tensors in ``samples`` and ``labels`` attributes anymore,
+    and are accessed by indexing the dataset (``dataset[idx]``). Similarly, the
+    ``files_paths`` attribute is a read-only sequence of ``Path`` objects and not a
+    list, it must be converted with ``list(dataset.files_paths)`` to be compared with
+    or modified as a list.
 
     **Important note:** you should probably use this class in concert with the
     :py:func:`miditok.pytorch_data.split_files_for_training` method in order to train
@@ -101,6 +132,27 @@ class DatasetMIDI(_DatasetABC):
     Additionally, you can use the ``func_to_get_labels`` argument to provide a method
     allowing to use labels (one label per file).
 
+    **Caching the tokens:** the ``cache_path`` argument allows to save the token ids of
+    the pre-tokenized files, and their labels if ``func_to_get_labels`` is provided, on
+    disk, so that the files do not have to be loaded and
+    tokenized again each time a ``DatasetMIDI`` is created with the same files,
+    tokenizer and parameters. The cache is created at the first initialization, and
+    is memory-mapped in the following ones, meaning that the token ids are not loaded
+    entirely in memory but read from the disk when the dataset is indexed. The cache is
+    automatically recreated if the tokenizer or any of the ``files_paths``,
+    ``max_seq_len``, ``bos_token_id``, ``eos_token_id`` or ``func_to_get_labels``
+    (compared by name) arguments differ from the ones it was created with, or if any
+    of the files was modified since.
+
+    **Caching the decoded files:** if you do not want to pre-tokenize the files, the
+    ``symusic_cache_dir`` argument allows to decode them once at initialization and
+    save the resulting ``symusic.Score`` objects in their binary pickle form. They are
+    then loaded from their pickle files, which is much faster than parsing the
+    original MIDI/abc files, when the dataset is indexed. The cache files are named
+    from the hash of the paths, modification times and sizes of the original files
+    and of the version of symusic, and are reused in the following initializations.
+    Files modified since they were cached are thus decoded again.
+
     **Handling of corrupted files:**
     Some MIDI files may be corrupted, as for example containing unexpected values.
     In such cases, if the ``DatasetMIDI`` pre-tokenizes, it will simply ignore these
@@ -124,6 +176,18 @@ class DatasetMIDI(_DatasetABC):
         iterating the dataset. (default: ``"input_ids"``)
     :param labels_key_name: name of the dictionary key containing the labels data when
         iterating the dataset. (default: ``"labels"``)
+    :param cache_path: path to the directory where to save or load the cached token
+        ids and labels. Providing it implies ``pre_tokenize``. (default: ``None``)
+    :param symusic_cache_dir: path to the directory where to save or load the pickled
+        ``symusic.Score`` objects of the files. (default: ``None``)
+    :param num_proc: number of processes to use to pre-tokenize the files. The
+        tokenizer and ``func_to_get_labels`` must be picklable to use more than one
+        process. (default: ``1``)
+    :param chunked: whether the files can be chunks created by
+        :py:func:`miditok.pytorch_data.split_files_for_training`, in which case their
+        markers are read to only add ``BOS`` and ``EOS`` tokens to the first and last
+        chunks. Set it to ``False`` if your files were not split in order to skip this
+        step. (default: ``True``)
     """
 
     def __init__(
@@ -141,43 +205,317 @@ class DatasetMIDI(_DatasetABC):
         | None = None,
         sample_key_name: str = "input_ids",
         labels_key_name: str = "labels",
+        cache_path: str | Path | None = None,
+        symusic_cache_dir: str | Path | None = None,
+        num_proc: int = 1,
+        chunked: bool = True,
     ) -> None:
-        super().__init__()
+        super().__init__(max_seq_len, bos_token_id, eos_token_id)
 
         # Set class attributes
-        self.files_paths = list(files_paths).copy()
+        self.files_paths = files_paths
         self.tokenizer = tokenizer
-        self.max_seq_len = max_seq_len
-        self.bos_token_id = bos_token_id
-        self.eos_token_id = eos_token_id
-        self.pre_tokenize = pre_tokenize
+        self.pre_tokenize = pre_tokenize or cache_path is not None
         self.func_to_get_labels = func_to_get_labels
         self.sample_key_name = sample_key_name
         self.labels_key_name = labels_key_name
-        self.samples, self.labels = [], [] if func_to_get_labels else None
+        self.cache_path = Path(cache_path) if cache_path is not None else None
+        self.symusic_cache_dir = (
+            Path(symusic_cache_dir) if symusic_cache_dir is not None else None
+        )
+        self.num_proc = num_proc
+        self.chunked = chunked
+        # Smallest dtype to store the token ids, they are cast to int64 when indexed
+        self._ids_dtype = np.int16 if len(tokenizer) < 2**15 else np.int32
+        # Pre-tokenized token ids and labels, concatenated and indexed by their offsets.
+        # When cached, they are memory-mapped and opened lazily in each process.
+        self._ids, self._offsets = None, None
+        self._labels, self._labels_offsets = None, None
+
+        # Thread loading the next file when tokenizing on the fly, created lazily in
+        # each process as threads do not survive forks
+        self._prefetch_pool, self._prefetch_pid = None, None
+        self._prefetched: tuple[int, Future] | None = None
+        self._last_idx = None
+        # Hashes naming the symusic cache files, computed once at initialization
+        self._score_cache_keys: np.ndarray | None = None
+
+        # Decode the files that are not already cached
+        if self.symusic_cache_dir is not None:
+            self._cache_scores()
+
+        # Load the cached tokens, create the cache if it does not exist or is outdated
+        if self.cache_path is not None:
+            if not self._is_cache_valid():
+                self._pre_tokenize_files()
+                self._save_cache()
+                # the samples are now read from the cache
+                self._ids = self._labels = None
+            self._offsets = np.load(self.cache_path / DATASET_CACHE_OFFSETS_FILE_NAME)
+            if func_to_get_labels is not None:
+                self._labels_offsets = np.load(
+                    self.cache_path / DATASET_CACHE_LABELS_OFFSETS_FILE_NAME
+                )
 
         # Pre-tokenize the files
-        if pre_tokenize:
-            for file_path in tqdm(
-                self.files_paths,
-                desc="Pre-tokenizing",
-                miniters=int(len(self.files_paths) / 20),
+        elif pre_tokenize:
+            self._pre_tokenize_files()
+
+    @property
+    def files_paths(self) -> Sequence[Path]:
+        """
+        Return the paths of the files of the dataset.
+
+        They are stored in a single string indexed by offsets, which is lighter than
+        one object per path, and are returned as a read-only sequence of ``Path``
+        objects, and not as a list.
+
+        :return: paths of the files of the dataset.
+        """
+        return self._files_paths
+
+    @files_paths.setter
+    def files_paths(self, files_paths: Sequence[str | Path]) -> None:
+        self._files_paths = _PackedPaths(files_paths)
+
+    def _path(self, idx: int) -> Path:
+        return self._files_paths[idx]
+
+    def _pre_tokenize_files(self) -> None:
+        files_paths = self.files_paths
+        if self.symusic_cache_dir is not None:
+            score_cache_paths = [
+                self._score_cache_path(idx) for idx in range(len(files_paths))
+            ]
+        else:
+            score_cache_paths = [None] * len(files_paths)
+        progress_bar_kwargs = {
+            "desc": "Pre-tokenizing",
+            "total": len(files_paths),
+            "miniters": int(len(files_paths) / 20),
+            "maxinterval": 480,
+        }
+        if self.num_proc > 1:
+            # The tokenizer is sent once to each worker process, at its initialization
+            worker_kwargs = {
+                "tokenizer": self.tokenizer,
+                "max_seq_len": self.max_seq_len,
+                "bos_token_id": self.bos_token_id,
+                "eos_token_id": self.eos_token_id,
+                "func_to_get_labels": self.func_to_get_labels,
+                "chunked": self.chunked,
+            }
+            with ProcessPoolExecutor(
+                self.num_proc,
+                initializer=_init_pre_tokenizing_worker,
+                initargs=(worker_kwargs,),
+            ) as executor:
+                files_samples = executor.map(
+                    _pre_tokenize_file, files_paths, score_cache_paths, chunksize=32
+                )
+                self._set_samples(tqdm(files_samples, **progress_bar_kwargs))
+        else:
+            files_samples = map(self._tokenize_file, files_paths, score_cache_paths)
+            self._set_samples(tqdm(files_samples, **progress_bar_kwargs))
+
+    def _tokenize_file(
+        self, file_path: Path, score_cache_path: Path | None = None
+    ) -> list[tuple[np.ndarray, Any | None]]:
+        # Returns the token ids of the samples of the file with their labels. The ids
+        # are returned as arrays to not be sent through shared memory by the worker
+        # processes, which would be inefficient for a large number of small tensors.
+        try:
+            score = self._load_score(file_path, score_cache_path)
+        except SCORE_LOADING_EXCEPTION:
+            return []
+        tokseq, token_ids = self._tokenize_score(score)
+        if self.tokenizer.one_token_stream:
+            tokseq = [tokseq]
+        return [
+            (
+                ids.numpy(),
+                self.func_to_get_labels(score, seq, file_path)
+                if self.func_to_get_labels
+                else None,
+            )
+            for seq, ids in zip(tokseq, token_ids)
+        ]
+
+    def _set_samples(
+        self, files_samples: Iterable[list[tuple[np.ndarray, Any | None]]]
+    ) -> None:
+        # Concatenates the samples in single arrays instead of keeping one tensor per
+        # sample, which would have a significant memory overhead for large datasets.
+        samples, labels = [], []
+        for file_samples in files_samples:
+            for ids, label in file_samples:
+                samples.append(ids.astype(self._ids_dtype))
+                if self.func_to_get_labels:
+                    labels.append(np.atleast_1d(np.asarray(label, dtype=np.int64)))
+        ids, self._offsets = _concatenate_samples(samples)
+        self._ids = ids.astype(self._ids_dtype, copy=False)
+        if self.func_to_get_labels:
+            self._labels, self._labels_offsets = _concatenate_samples(labels)
+
+    def _score_cache_path(self, idx: int) -> Path:
+        cache_key = self._score_cache_keys[idx].tobytes().hex()
+        return self.symusic_cache_dir / f"{cache_key}.pkl"
+
+    def _cache_scores(self) -> None:
+        self.symusic_cache_dir.mkdir(parents=True, exist_ok=True)
+        files_paths = self.files_paths
+        # sha256 digests, the files that cannot be accessed keep a null digest
+        self._score_cache_keys = np.zeros((len(files_paths), 32), dtype=np.uint8)
+        for idx, file_path in enumerate(
+            tqdm(
+                files_paths,
+                desc="Caching decoded files",
+                miniters=int(len(files_paths) / 20),
                 maxinterval=480,
-            ):
-                try:
-                    score = Score(file_path)
-                except SCORE_LOADING_EXCEPTION:
-                    continue
-                tokseq = self._tokenize_score(score)
-                if tokenizer.one_token_stream:
-                    tokseq = [tokseq]
-                for seq in tokseq:
-                    self.samples.append(LongTensor(seq.ids))
-                    if func_to_get_labels:
-                        label = func_to_get_labels(score, seq, file_path)
-                        if not isinstance(label, LongTensor):
-                            label = LongTensor(label)
-                        self.labels.append(label)
+            )
+        ):
+            # The modification time, size and symusic version invalidate the cache
+            try:
+                file_path_resolved = file_path.resolve()
+                stat = file_path_resolved.stat()
+            except OSError:
+                continue
+            cache_key = (
+                f"{file_path_resolved}\0{stat.st_mtime_ns}\0{stat.st_size}\0"
+                f"{CURRENT_SYMUSIC_VERSION}"
+            )
+            self._score_cache_keys[idx] = np.frombuffer(
+                sha256(cache_key.encode()).digest(), dtype=np.uint8
+            )
+            cache_file_path = self._score_cache_path(idx)
+            if cache_file_path.is_file():
+                continue
+            try:
+                score = Score(file_path)
+            except SCORE_LOADING_EXCEPTION:
+                continue
+            # Written to a temporary file first so that an interrupted write does not
+            # leave a truncated cache file
+            tmp_file_path = cache_file_path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file_path.write_bytes(pickle.dumps(score))
+            tmp_file_path.replace(cache_file_path)
+
+    @staticmethod
+    def _load_score(
+        file_path: str | Path, score_cache_path: Path | None = None
+    ) -> Score:
+        # Loads the Score from its pickle cache if it exists, otherwise parses the file
+        if score_cache_path is not None and score_cache_path.is_file():
+            return pickle.loads(score_cache_path.read_bytes())  # noqa: S301
+        return Score(file_path)
+
+    def _load_file_score(self, idx: int) -> Score:
+        score_cache_path = (
+            self._score_cache_path(idx) if self.symusic_cache_dir is not None else None
+        )
+        return self._load_score(self._path(idx), score_cache_path)
+
+    def _load_score_prefetched(self, idx: int) -> Score:
+        # When the files are read sequentially, the next one is loaded in a thread
+        # while the current one is tokenized, so that reading it from the disk overlaps
+        # with the tokenization. Files read in random order are loaded directly.
+        # Nothing is prefetched by the processes of a DataLoader with several workers,
+        # as consecutive indexes can be read by different workers.
+        if self._prefetch_pid != os.getpid():
+            worker_info = get_worker_info()
+            self._prefetch_pool = (
+                ThreadPoolExecutor(max_workers=1)
+                if worker_info is None or worker_info.num_workers == 1
+                else None
+            )
+            self._prefetch_pid = os.getpid()
+            self._prefetched = self._last_idx = None
+        if self._prefetch_pool is None:
+            return self._load_file_score(idx)
+
+        prefetched, self._prefetched = self._prefetched, None
+        sequential = self._last_idx is not None and idx == self._last_idx + 1
+        if sequential and idx + 1 < len(self._files_paths):
+            next_future = self._prefetch_pool.submit(self._load_file_score, idx + 1)
+            self._prefetched = (idx + 1, next_future)
+        self._last_idx = idx
+        if prefetched is not None and prefetched[0] == idx:
+            return prefetched[1].result()
+        return self._load_file_score(idx)
+
+    def _cache_metadata(self) -> dict[str, Any]:
+        tokenizer_json = json.dumps(self.tokenizer.to_dict(), sort_keys=True)
+        # The modification times and sizes invalidate the cache of edited files
+        files_stats = []
+        for file_path in self.files_paths:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                files_stats.append((str(file_path), None, None))
+            else:
+                files_stats.append((str(file_path), stat.st_mtime_ns, stat.st_size))
+        files_json = json.dumps(files_stats)
+        labels_func_name = getattr(self.func_to_get_labels, "__qualname__", None)
+        return {
+            "tokenizer_hash": sha256(tokenizer_json.encode()).hexdigest(),
+            "files_hash": sha256(files_json.encode()).hexdigest(),
+            "max_seq_len": self.max_seq_len,
+            "bos_token_id": self.bos_token_id,
+            "eos_token_id": self.eos_token_id,
+            "func_to_get_labels": labels_func_name,
+            "chunked": self.chunked,
+        }
+
+    def _is_cache_valid(self) -> bool:
+        metadata_path = self.cache_path / DATASET_CACHE_METADATA_FILE_NAME
+        if not metadata_path.is_file():
+            return False
+        with metadata_path.open() as metadata_file:
+            try:
+                metadata = json.load(metadata_file)
+            except ValueError:  # corrupted metadata file
+                return False
+        return metadata == self._cache_metadata()
+
+    def _save_cache(self) -> None:
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+        # The metadata of an outdated cache is removed before overwriting its arrays
+        metadata_path = self.cache_path / DATASET_CACHE_METADATA_FILE_NAME
+        metadata_path.unlink(missing_ok=True)
+        np.save(self.cache_path / DATASET_CACHE_IDS_FILE_NAME, self._ids)
+        np.save(self.cache_path / DATASET_CACHE_OFFSETS_FILE_NAME, self._offsets)
+        if self.func_to_get_labels is not None:
+            np.save(self.cache_path / DATASET_CACHE_LABELS_FILE_NAME, self._labels)
+            np.save(
+                self.cache_path / DATASET_CACHE_LABELS_OFFSETS_FILE_NAME,
+                self._labels_offsets,
+            )
+        # Written last so that an interrupted caching is not considered valid
+        with metadata_path.open("w") as file:
+            json.dump(self._cache_metadata(), file, indent=4)
+
+    def _get_pre_tokenized_sample(
+        self, idx: int
+    ) -> tuple[LongTensor, LongTensor | None]:
+        idx = _normalize_index(idx, len(self))
+        # Opens the memory-mapped cache if not already done in this process
+        if self._ids is None:
+            self._ids = np.load(
+                self.cache_path / DATASET_CACHE_IDS_FILE_NAME, mmap_mode="r"
+            )
+        start, end = self._offsets[idx], self._offsets[idx + 1]
+        token_ids = torch.from_numpy(self._ids[start:end].astype(np.int64))
+
+        labels = None
+        if self.func_to_get_labels is not None:
+            if self._labels is None:
+                self._labels = np.load(
+                    self.cache_path / DATASET_CACHE_LABELS_FILE_NAME, mmap_mode="r"
+                )
+            start, end = self._labels_offsets[idx], self._labels_offsets[idx + 1]
+            labels = torch.from_numpy(self._labels[start:end].astype(np.int64))
+
+        return token_ids, labels
 
     def __getitem__(self, idx: int) -> dict[str, LongTensor]:
         """
@@ -192,22 +530,20 @@ class DatasetMIDI(_DatasetABC):
         """
         labels = None
 
-        # Already pre-tokenized
+        # Already pre-tokenized, in memory or cached
         if self.pre_tokenize:
-            token_ids = self.samples[idx]
-            if self.func_to_get_labels is not None:
-                labels = self.labels[idx]
+            token_ids, labels = self._get_pre_tokenized_sample(idx)
 
         # Tokenize on the fly
         else:
+            file_path = self._path(idx)
             try:
-                score = Score(self.files_paths[idx])
-                tseq = self._tokenize_score(score)
-                # If not one_token_stream, we only take the first track/sequence
-                token_ids = tseq.ids if self.tokenizer.one_token_stream else tseq[0].ids
+                score = self._load_score_prefetched(idx)
+                # If not one_token_stream, only the first track/sequence is tokenized
+                tseq, (token_ids,) = self._tokenize_score(score)
                 if self.func_to_get_labels is not None:
                     # tokseq can be given as a list of TokSequence to get the labels
-                    labels = self.func_to_get_labels(score, tseq, self.files_paths[idx])
+                    labels = self.func_to_get_labels(score, tseq, file_path)
                     if not isinstance(labels, LongTensor):
                         labels = LongTensor(
                             [labels] if isinstance(labels, int) else labels
@@ -215,17 +551,15 @@ class DatasetMIDI(_DatasetABC):
             except SCORE_LOADING_EXCEPTION:
                 token_ids = None
 
-        item = {
-            self.sample_key_name: LongTensor(token_ids)
-            if token_ids is not None
-            else None
-        }
+        item = {self.sample_key_name: token_ids}
         if self.func_to_get_labels is not None:
             item[self.labels_key_name] = labels
 
         return item
 
-    def _tokenize_score(self, score: Score) -> TokSequence | list[TokSequence]:
+    def _tokenize_score(
+        self, score: Score
+    ) -> tuple[TokSequence | list[TokSequence], list[LongTensor]]:
         # Tokenize it
         tokseq = self.tokenizer.encode(score)
 
@@ -238,36 +572,31 @@ class DatasetMIDI(_DatasetABC):
         # self.bos_token_id and self.eos_token_id (that may be None), except when the
         # file is identified as a chunk.
         add_bos_token = add_eos_token = True
-        for marker in score.markers:
-            if marker.time != 0:
-                break
-            if marker.text.startswith("miditok: chunk"):
-                chunk_id, chunk_id_last = map(
-                    int, marker.text.split(" ")[-1].split("/")
-                )
-                add_bos_token = chunk_id == 0
-                add_eos_token = chunk_id == chunk_id_last
-
-        # Preprocessing token ids: reduce sequence length, add BOS/EOS tokens
-        if self.tokenizer.one_token_stream:
-            tokseq.ids = self._preprocess_token_ids(
-                tokseq.ids,
-                self.max_seq_len,
-                self.bos_token_id if add_bos_token else None,
-                self.eos_token_id if add_eos_token else None,
+        if self.chunked:
+            for marker in score.markers:
+                if marker.time != 0:
+                    break
+                if match := _CHUNK_MARKER_PATTERN.match(marker.text):
+                    chunk_id, chunk_id_last = match.group(1, 2)
+                    add_bos_token = chunk_id == "0"
+                    add_eos_token = chunk_id == chunk_id_last
+
+        # Preprocessing token ids: reduce sequence length, add BOS/EOS tokens.
+        # The tensors are returned separately, the TokSequences given to
+        # func_to_get_labels keep their preprocessed ids as lists.
+        token_ids = []
+        for seq in [tokseq] if self.tokenizer.one_token_stream else tokseq:
+            ids = self._preprocess_token_ids(
+                _ids_to_tensor(seq.ids),
+                add_bos_token,
+                add_eos_token,
                 enforce_eos_token_if_seq_len_exceed_lim=False,
             )
-        else:
-            for seq in tokseq:
-                seq.ids = self._preprocess_token_ids(
-                    seq.ids,
-                    self.max_seq_len,
-                    self.bos_token_id if add_bos_token else None,
-                    self.eos_token_id if add_eos_token else None,
-                    enforce_eos_token_if_seq_len_exceed_lim=False,
-                )
+            if self.func_to_get_labels is not None:
+                seq.ids = ids.tolist()
+            token_ids.append(ids)
 
-        return tokseq
+        return tokseq, token_ids
 
     def __len__(self) -> int:
         """
@@ -275,15 +604,141 @@ class DatasetMIDI(_DatasetABC):
 
         :return: number of elements in the dataset.
         """
-        return len(self.samples) if self.pre_tokenize else len(self.files_paths)
+        if self.pre_tokenize:
+            return len(self._offsets) - 1
+        return len(self._files_paths)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Return the state of the dataset to pickle, e.g. for ``DataLoader`` workers.
+
+        The memory-mapped cache and the prefetching thread are not pickled, as they are
+        recreated by each process.
+
+        :return: the state of the dataset.
+        """
+        state = self.__dict__.copy()
+        state["_prefetch_pool"] = state["_prefetch_pid"] = state["_prefetched"] = None
+        if self.cache_path is not None:
+            state["_ids"] = state["_labels"] = None
+        return state
 
     def __repr__(self) -> str:  # noqa:D105
         return self.__str__()
 
     def __str__(self) -> str:  # noqa:D105
+        if self.cache_path is not None:
+            return f"Cached pre-tokenized dataset with {len(self)} samples"
         if self.pre_tokenize:
-            return f"Pre-tokenized dataset with {len(self.samples)} samples"
-        return f"{len(self.files_paths)} files."
+            return f"Pre-tokenized dataset with {len(self)} samples"
+        return f"{len(self)} files."
+
+
+def _ids_to_tensor(ids: list[int | list[int]] | np.ndarray) -> LongTensor:
+    r"""
+    Convert token ids to a ``LongTensor``.
+
+    The ids are converted through a NumPy array, which is faster than creating the
+    ``LongTensor`` from a list as it does not unpack each integer in Python. The tensor
+    shares the memory of the array.
+
+    :param ids: token ids.
+    :return: the token ids as a ``LongTensor``.
+    """
+    return torch.from_numpy(np.asarray(ids, dtype=np.int64))
+
+
+def _normalize_index(idx: int, length: int) -> int:
+    r"""
+    Convert a possibly negative index to a positive one, and check its range.
+
+    :param idx: index, possibly negative to index from the end.
+    :param length: length of the indexed sequence.
+    :return: the positive index.
+    """
+    if not -length <= idx < length:
+        msg = f"Index {idx} is out of range for {length} elements."
+        raise IndexError(msg)
+    return idx + length if idx < 0 else idx
+
+
+def _concatenate_samples(
+    samples: Sequence[np.ndarray | LongTensor],
+) -> tuple[np.ndarray, np.ndarray]:
+    r"""
+    Concatenate samples into a single array, along with the offsets of each sample.
+
+    The ``offsets`` array has ``len(samples) + 1`` elements, the sample ``i`` spanning
+    the indexes ``offsets[i]`` to ``offsets[i + 1]`` of the concatenated array.
+
+    :param samples: samples to concatenate, as arrays or tensors.
+    :return: the concatenated samples and their offsets.
+    """
+    offsets = np.zeros(len(samples) + 1, dtype=np.int64)
+    lengths = np.array([len(sample) for sample in samples], dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    # Empty samples are skipped as their shape might differ, they have no offset
+    arrays = [np.asarray(sample) for sample in samples if len(sample) > 0]
+    concatenated = np.concatenate(arrays) if len(arrays) > 0 else np.zeros(0)
+    return concatenated, offsets
+
+
+class _PackedPaths(Sequence):
+    r"""
+    Read-only sequence of paths, stored concatenated in a single string.
+
+    The path ``i`` spans the characters ``offsets[i]`` to ``offsets[i + 1]`` of the
+    concatenated string, which uses much less memory than one object per path for
+    large numbers of paths. The ``Path`` objects are created when indexed.
+
+    :param paths: paths to store.
+    """
+
+    def __init__(self, paths: Iterable[str | Path]) -> None:
+        paths = list(map(str, paths))
+        self._string = "".join(paths)
+        self._offsets = np.zeros(len(paths) + 1, dtype=np.int64)
+        lengths = np.array([len(path) for path in paths], dtype=np.int64)
+        np.cumsum(lengths, out=self._offsets[1:])
+
+    def __getitem__(self, idx: int | slice) -> Path | list[Path]:
+        """
+        Return the ``idx`` path, or a list of paths if ``idx`` is a slice.
+
+        :param idx: index or slice of the paths to return.
+        :return: the path(s).
+        """
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self)))]
+        idx = _normalize_index(idx, len(self))
+        return Path(self._string[self._offsets[idx] : self._offsets[idx + 1]])
+
+    def __len__(self) -> int:
+        """
+        Return the number of paths.
+
+        :return: number of paths.
+        """
+        return len(self._offsets) - 1
+
+
+# Dataset used by the worker processes to pre-tokenize files in parallel, created with
+# the same parameters as the main dataset
+_pre_tokenizing_worker_dataset: DatasetMIDI | None = None
+
+
+def _init_pre_tokenizing_worker(dataset_kwargs: dict[str, Any]) -> None:
+    global _pre_tokenizing_worker_dataset
+    # Created without pre-tokenizing nor caching to skip these steps of __init__, the
+    # paths of the symusic cache files are given with the files to tokenize
+    _pre_tokenizing_worker_dataset = DatasetMIDI([], **dataset_kwargs)
+    _pre_tokenizing_worker_dataset.pre_tokenize = True
+
+
+def _pre_tokenize_file(
+    file_path: Path, score_cache_path: Path | None
+) -> list[tuple[np.ndarray, Any | None]]:
+    return _pre_tokenizing_worker_dataset._tokenize_file(file_path, score_cache_path)
 
 
 class DatasetJSON(_DatasetABC):
@@ -317,14 +772,8 @@ class DatasetJSON(_DatasetABC):
         bos_token_id: int | None = None,
         eos_token_id: int | None = None,
     ) -> None:
+        super().__init__(max_seq_len, bos_token_id, eos_token_id)
         self.files_paths = files_paths
-        self.max_seq_len = max_seq_len
-        self.bos_token_id = bos_token_id
-        self.eos_token_id = eos_token_id
-        self._effective_max_seq_len = max_seq_len - sum(
-            [1 for tok in [bos_token_id, eos_token_id] if tok is not None]
-        )
-        super().__init__()
 
     def __getitem__(self, idx: int) -> dict[str, LongTensor]:
         """
@@ -333,16 +782,119 @@ class DatasetJSON(_DatasetABC):
         :param idx: index of the file to load.
         :return: the tokens as a dictionary mapping to the token ids as a tensor.
         """
-        with self.files_paths[idx].open() as json_file:
-            token_ids = json.load(json_file)["ids"]
+        # orjson is used if installed, parsing the bytes without decoding them first
+        token_ids = json_loads(self.files_paths[idx].read_bytes())["ids"]
+        token_ids = self._preprocess_token_ids(_ids_to_tensor(token_ids))
+
+        return {"input_ids": token_ids}
+
+    def pack_to_binary(self, out_dir: str | Path) -> None:
+        r"""
+        Pack the token ids of the JSON files into binary files.
+
+        The token ids of all the files are concatenated into a single ``int32`` array
+        saved in ``out_dir``, along with the offsets of the token ids of each file.
+        The packed dataset can then be loaded with
+        :class:`miditok.pytorch_data.DatasetBinary`, which memory-maps it instead of
+        parsing JSON files. The token ids are saved as they are in the JSON files,
+        the ``max_seq_len``, ``bos_token_id`` and ``eos_token_id`` are applied by
+        the :class:`miditok.pytorch_data.DatasetBinary`.
+
+        :param out_dir: path to the directory where to save the packed token ids.
+        """
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        ids_path = out_dir / DATASET_CACHE_IDS_FILE_NAME
+        raw_ids_path = ids_path.with_suffix(".tmp")
+
+        # The token ids of each file are appended to a raw binary file as they are
+        # parsed, so that the token ids of all the files are never held in memory
+        offsets = np.zeros(len(self.files_paths) + 1, dtype=np.int64)
+        sample_shape = ()  # number of vocabularies, if multiple
+        with raw_ids_path.open("wb") as raw_ids_file:
+            for idx, file_path in enumerate(
+                tqdm(
+                    self.files_paths,
+                    desc="Packing token ids",
+                    miniters=int(len(self.files_paths) / 20),
+                    maxinterval=480,
+                )
+            ):
+                ids = np.asarray(
+                    json_loads(file_path.read_bytes())["ids"], dtype=np.int32
+                )
+                if len(ids) > 0:
+                    sample_shape = ids.shape[1:]
+                    ids.tofile(raw_ids_file)
+                offsets[idx + 1] = offsets[idx] + len(ids)
+
+        # Copies the raw token ids into a .npy file, through memory-maps
+        ids_shape = (int(offsets[-1]), *sample_shape)
+        if offsets[-1] == 0:
+            np.save(ids_path, np.zeros(ids_shape, dtype=np.int32))
+        else:
+            ids = np.lib.format.open_memmap(ids_path, "w+", np.int32, ids_shape)
+            ids[:] = np.memmap(raw_ids_path, np.int32, "r", shape=ids_shape)
+            ids.flush()
+            del ids
+        raw_ids_path.unlink()
+        np.save(out_dir / DATASET_CACHE_OFFSETS_FILE_NAME, offsets)
+
+    def __len__(self) -> int:
+        """
+        Return the size of the dataset.
+
+        :return: number of elements in the dataset.
+        """
+        return len(self.files_paths)
+
+
+class DatasetBinary(_DatasetABC):
+    r"""
+    ``Dataset`` loading token ids packed in binary files.
+
+    The token ids must have been packed with the
+    :py:func:`miditok.pytorch_data.DatasetJSON.pack_to_binary` method. They are
+    memory-mapped, so that they are not loaded in memory but read from the disk when
+    the dataset is indexed, which is much faster than parsing JSON files. As with
+    :class:`miditok.pytorch_data.DatasetJSON`, indexing a ``DatasetBinary`` returns
+    the token ids that can be used to train generative models.
+
+    :param path: path to the directory containing the packed token ids.
+    :param max_seq_len: maximum sequence length (in num of tokens).
+    :param bos_token_id: *BOS* token id. (default: ``None``)
+    :param eos_token_id: *EOS* token id. (default: ``None``)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_seq_len: int,
+        bos_token_id: int | None = None,
+        eos_token_id: int | None = None,
+    ) -> None:
+        super().__init__(max_seq_len, bos_token_id, eos_token_id)
+        self.path = Path(path)
+        self._offsets = np.load(self.path / DATASET_CACHE_OFFSETS_FILE_NAME)
+        # Memory-mapped token ids, opened lazily in each process
+        self._ids = None
+
+    def __getitem__(self, idx: int) -> dict[str, LongTensor]:
+        """
+        Load the tokens of the ``idx`` sample.
+
+        :param idx: index of the sample to load.
+        :return: the tokens as a dictionary mapping to the token ids as a tensor.
+        """
+        idx = _normalize_index(idx, len(self))
+        if self._ids is None:
+            self._ids = np.load(self.path / DATASET_CACHE_IDS_FILE_NAME, mmap_mode="r")
+        start, end = self._offsets[idx], self._offsets[idx + 1]
         token_ids = self._preprocess_token_ids(
-            token_ids,
-            self._effective_max_seq_len,
-            self.bos_token_id,
-            self.eos_token_id,
+            torch.from_numpy(self._ids[start:end].astype(np.int64))
         )
 
-        return {"input_ids": LongTensor(token_ids)}
+        return {"input_ids": token_ids}
 
     def __len__(self) -> int:
         """
@@ -350,4 +902,17 @@ class DatasetJSON(_DatasetABC):
 
         :return: number of elements in the dataset.
         """
-        return len(self.files_paths)
+        return len(self._offsets) - 1
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Return the state of the dataset to pickle, e.g. for ``DataLoader`` workers.
+
+        The memory-mapped token ids are not pickled, as they are reopened by each
+        process.
+
+        :return: the state of the dataset.
+        """
+        state = self.__dict__.copy()
+        state["_ids"] = None
+        return state
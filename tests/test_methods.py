@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import pytest
 from miditoolkit import Instrument, MidiFile, Pedal
 from tensorflow import Tensor as tfTensor
 from tensorflow import convert_to_tensor
@@ -42,6 +43,17 @@ def test_convert_tensors() -> None:
         assert as_list == original
 
 
+def test_token_id_type() -> None:
+    tokenizer = miditok.TSD()
+    assert tokenizer.token_id_type(tokenizer["Pitch_60"]) == "Pitch"
+
+    # Multiple vocabularies require a vocab_id
+    tokenizer = miditok.Octuple()
+    assert tokenizer.token_id_type(tokenizer.vocab[0]["Pitch_60"], 0) == "Pitch"
+    with pytest.raises(ValueError):
+        tokenizer.token_id_type(3)
+
+
 def test_tokenize_datasets_file_tree(
     tmp_path: Path, midi_paths: list[str | Path] | None = None
 ) -> None:
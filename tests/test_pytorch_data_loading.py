@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from time import time
 from typing import TYPE_CHECKING
 
@@ -126,6 +127,220 @@ def test_dataset_midi(
         pass
 
 
+@pytest.mark.parametrize(
+    "tokenizer_cls", [miditok.TSD, miditok.Octuple], ids=["TSD", "Octuple"]
+)
+def test_dataset_midi_cache(
+    tmp_path: Path,
+    tokenizer_cls: Callable,
+    files_paths: Sequence[Path] = MIDI_PATHS_MULTITRACK + MIDI_PATHS_CORRUPTED,
+    max_seq_len: int = 1000,
+):
+    tokenizer = tokenizer_cls(miditok.TokenizerConfig(use_programs=True))
+    cache_path = tmp_path / "cache"
+    dataset_args = (files_paths, tokenizer, max_seq_len, tokenizer["BOS_None"])
+    dataset = miditok.pytorch_data.DatasetMIDI(
+        *dataset_args, pre_tokenize=True, func_to_get_labels=get_labels_seq_len
+    )
+
+    # First call creates the cache, second one loads it
+    for _ in range(2):
+        dataset_cached = miditok.pytorch_data.DatasetMIDI(
+            *dataset_args, func_to_get_labels=get_labels_seq_len, cache_path=cache_path
+        )
+        assert len(dataset_cached) == len(dataset)
+        for i in range(-len(dataset), len(dataset)):
+            for key in ("input_ids", "labels"):
+                assert dataset_cached[i][key].equal(dataset[i][key])
+        for i in (len(dataset), -len(dataset) - 1):
+            with pytest.raises(IndexError):
+                dataset_cached[i]
+
+    # A corrupted metadata file invalidates the cache
+    (cache_path / "metadata.json").write_text("{")
+    dataset_cached = miditok.pytorch_data.DatasetMIDI(
+        *dataset_args, func_to_get_labels=get_labels_seq_len, cache_path=cache_path
+    )
+    assert len(dataset_cached) == len(dataset)
+
+    # Different parameters invalidate the cache
+    dataset_cached = miditok.pytorch_data.DatasetMIDI(
+        *dataset_args[:2], 100, cache_path=cache_path
+    )
+    assert all(
+        len(dataset_cached[i]["input_ids"]) <= 100 for i in range(len(dataset_cached))
+    )
+
+    # The memory-mapped cache is reopened by each worker
+    collator = miditok.pytorch_data.DataCollator(tokenizer.pad_token_id)
+    dataloader = DataLoader(dataset_cached, 16, collate_fn=collator, num_workers=2)
+    for _ in dataloader:
+        pass
+
+
+def test_dataset_midi_num_proc(
+    files_paths: Sequence[Path] = MIDI_PATHS_MULTITRACK + MIDI_PATHS_CORRUPTED,
+    max_seq_len: int = 1000,
+):
+    tokenizer = miditok.TSD()
+    datasets = [
+        miditok.pytorch_data.DatasetMIDI(
+            files_paths,
+            tokenizer,
+            max_seq_len,
+            pre_tokenize=True,
+            func_to_get_labels=get_labels_seq_len,
+            num_proc=num_proc,
+        )
+        for num_proc in (1, 2)
+    ]
+
+    assert len(datasets[0]) == len(datasets[1])
+    for i in range(len(datasets[0])):
+        for key in ("input_ids", "labels"):
+            assert datasets[0][i][key].equal(datasets[1][i][key])
+
+
+def test_dataset_midi_symusic_cache(
+    tmp_path: Path,
+    files_paths: Sequence[Path] = MIDI_PATHS_ONE_TRACK + MIDI_PATHS_CORRUPTED,
+    max_seq_len: int = 1000,
+):
+    tokenizer = miditok.TSD()
+    dataset = miditok.pytorch_data.DatasetMIDI(files_paths, tokenizer, max_seq_len)
+
+    # First call creates the cache, second one loads it
+    for _ in range(2):
+        dataset_cached = miditok.pytorch_data.DatasetMIDI(
+            files_paths,
+            tokenizer,
+            max_seq_len,
+            symusic_cache_dir=tmp_path / "symusic_cache",
+        )
+        for i in range(len(dataset)):
+            sample, sample_cached = dataset[i], dataset_cached[i]
+            if sample["input_ids"] is None:  # corrupted file
+                assert sample_cached["input_ids"] is None
+            else:
+                assert sample_cached["input_ids"].equal(sample["input_ids"])
+    assert not list((tmp_path / "symusic_cache").glob("*.tmp"))
+
+    # Modified files are decoded and cached again
+    file_path = tmp_path / files_paths[0].name
+    file_path.write_bytes(files_paths[0].read_bytes())
+    num_cache_files = []
+    for mtime in (1e9, 2e9):
+        os.utime(file_path, (mtime, mtime))
+        miditok.pytorch_data.DatasetMIDI(
+            [file_path],
+            tokenizer,
+            max_seq_len,
+            symusic_cache_dir=tmp_path / "symusic_cache_modified",
+        )
+        num_cache_files.append(
+            len(list((tmp_path / "symusic_cache_modified").glob("*.pkl")))
+        )
+    assert num_cache_files == [1, 2]
+
+
+def test_dataset_midi_labels_tokseq_ids(
+    files_paths: Sequence[Path] = MIDI_PATHS_ONE_TRACK,
+    max_seq_len: int = 1000,
+):
+    def get_labels_ids_type(_: Score, tokseq: miditok.TokSequence, __: Path) -> int:
+        # The ids of the TokSequence given to the labels function are a list
+        if isinstance(tokseq, list):
+            tokseq = tokseq[0]
+        assert isinstance(tokseq.ids, list)
+        return len(tokseq.ids)
+
+    tokenizer = miditok.TSD()
+    for pre_tokenize in (True, False):
+        dataset = miditok.pytorch_data.DatasetMIDI(
+            files_paths,
+            tokenizer,
+            max_seq_len,
+            tokenizer["BOS_None"],
+            pre_tokenize=pre_tokenize,
+            func_to_get_labels=get_labels_ids_type,
+        )
+        for i in range(len(dataset)):
+            sample = dataset[i]
+            assert sample["labels"].item() == len(sample["input_ids"])
+
+
+def test_dataset_midi_prefetch(
+    files_paths: Sequence[Path] = MIDI_PATHS_ONE_TRACK + MIDI_PATHS_CORRUPTED,
+    max_seq_len: int = 1000,
+):
+    tokenizer = miditok.TSD()
+    dataset = miditok.pytorch_data.DatasetMIDI(files_paths, tokenizer, max_seq_len)
+
+    # The next file is prefetched after two sequential reads, not after a random one
+    dataset[0]
+    assert dataset._prefetched is None
+    dataset[1]
+    assert dataset._prefetched is not None
+    assert dataset._prefetched[0] == 2
+    dataset[len(dataset) - 1]
+    assert dataset._prefetched is None
+
+    # The samples must not depend on the order
+    samples = [dataset[i]["input_ids"] for i in range(len(dataset))]
+    for i in reversed(range(len(dataset))):
+        sample = dataset[i]["input_ids"]
+        if samples[i] is None:  # corrupted file
+            assert sample is None
+        else:
+            assert sample.equal(samples[i])
+
+
+def test_dataset_midi_files_paths(
+    files_paths: Sequence[Path] = MIDI_PATHS_ONE_TRACK + MIDI_PATHS_CORRUPTED,
+    max_seq_len: int = 1000,
+):
+    tokenizer = miditok.TSD()
+    dataset = miditok.pytorch_data.DatasetMIDI(files_paths, tokenizer, max_seq_len)
+
+    assert list(dataset.files_paths) == list(files_paths)
+    assert dataset.files_paths[-1].stem == files_paths[-1].stem
+    assert dataset.files_paths[1:3] == list(files_paths[1:3])
+    for idx in (len(files_paths), -len(files_paths) - 1):
+        with pytest.raises(IndexError):
+            dataset.files_paths[idx]
+
+    # The paths can be replaced
+    dataset.files_paths = files_paths[:2]
+    assert len(dataset) == 2
+
+
+def test_dataset_midi_chunked(
+    tmp_path: Path,
+    files_paths: Sequence[Path] = MIDI_PATHS_ONE_TRACK,
+    max_seq_len: int = 200,
+):
+    tokenizer = miditok.TSD()
+    files_paths = miditok.utils.split_files_for_training(
+        files_paths, tokenizer, tmp_path, max_seq_len
+    )
+    bos_token_id = tokenizer["BOS_None"]
+
+    # BOS tokens are only added to the first chunks, unless the markers are not read
+    num_bos_tokens = []
+    for chunked in (True, False):
+        dataset = miditok.pytorch_data.DatasetMIDI(
+            files_paths, tokenizer, max_seq_len, bos_token_id, chunked=chunked
+        )
+        num_bos_tokens.append(
+            sum(
+                int(dataset[i]["input_ids"][0] == bos_token_id)
+                for i in range(len(dataset))
+                if dataset[i]["input_ids"] is not None
+            )
+        )
+    assert num_bos_tokens[0] < num_bos_tokens[1]
+
+
 def test_dataset_json(tmp_path: Path, file_paths: Sequence[Path] | None = None):
     if file_paths is None:
         file_paths = MIDI_PATHS_MULTITRACK[:5]
@@ -154,6 +369,58 @@ def test_dataset_json(tmp_path: Path, file_paths: Sequence[Path] | None = None):
         pass
 
 
+def test_dataset_binary(tmp_path: Path, file_paths: Sequence[Path] | None = None):
+    if file_paths is None:
+        file_paths = MIDI_PATHS_MULTITRACK[:5]
+    tokens_dir_path = tmp_path / "multitrack_tokens_dataset_json"
+    tokenizer = miditok.TSD(miditok.TokenizerConfig(use_programs=True))
+    tokenizer.tokenize_dataset(file_paths, tokens_dir_path)
+
+    dataset_json = miditok.pytorch_data.DatasetJSON(
+        list(tokens_dir_path.glob("**/*.json")), 1000
+    )
+    dataset_json.pack_to_binary(tmp_path / "packed")
+    dataset = miditok.pytorch_data.DatasetBinary(tmp_path / "packed", 1000)
+
+    assert len(dataset) == len(dataset_json)
+    for i in range(len(dataset)):
+        assert dataset[i]["input_ids"].equal(dataset_json[i]["input_ids"])
+
+    # Negative indexes are supported, out of range ones raise an IndexError
+    assert dataset[-1]["input_ids"].equal(dataset_json[-1]["input_ids"])
+    for idx in (len(dataset), -len(dataset) - 1):
+        with pytest.raises(IndexError):
+            dataset[idx]
+
+    # Iterating the dataset stops at the IndexError raised by __getitem__
+    assert sum(1 for _ in dataset) == len(dataset)
+
+
+def test_dataset_json_binary_max_seq_len(
+    tmp_path: Path, file_paths: Sequence[Path] | None = None, max_seq_len: int = 100
+):
+    if file_paths is None:
+        file_paths = MIDI_PATHS_MULTITRACK[:5]
+    tokens_dir_path = tmp_path / "multitrack_tokens_dataset_json"
+    tokenizer = miditok.TSD(miditok.TokenizerConfig(use_programs=True))
+    tokenizer.tokenize_dataset(file_paths, tokens_dir_path)
+
+    # A BOS token of id 0 is added, and counted in the max_seq_len only once
+    bos_token_id = 0
+    dataset_json = miditok.pytorch_data.DatasetJSON(
+        list(tokens_dir_path.glob("**/*.json")), max_seq_len, bos_token_id
+    )
+    dataset_json.pack_to_binary(tmp_path / "packed")
+    dataset_binary = miditok.pytorch_data.DatasetBinary(
+        tmp_path / "packed", max_seq_len, bos_token_id
+    )
+    for dataset in (dataset_json, dataset_binary):
+        for i in range(len(dataset)):
+            token_ids = dataset[i]["input_ids"]
+            assert len(token_ids) == max_seq_len
+            assert token_ids[0] == bos_token_id
+
+
 def test_collator():
     collator = miditok.pytorch_data.DataCollator(
         0,